@@ -1,94 +1,181 @@
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from subprocess import Popen, PIPE
+from asyncio.subprocess import PIPE
 from fastapi.responses import StreamingResponse
+from functools import lru_cache
+import asyncio
 import os
+import re
+import shutil
+import time
 from typing import List
 
 USER = os.getenv("USER") or os.getlogin()
 SCRIPTS_DIR = f"/home/{USER}/projet-riven/riven-frontend/scripts"
 
-# Création du router pour les scripts Bash avec le préfixe `/scripts`
-router = APIRouter(
-    prefix="/scripts",  # Toutes les routes seront préfixées par `/scripts`
-    tags=["scripts"],
-    responses={404: {"description": "Not found"}},
-)
+SSE_PREFIX = b"data: "
+SSE_ERROR_PREFIX = b"data: Erreur: "
+SSE_SUFFIX = b"\n\n"
+SSE_END = b"event: end\ndata: Fin du script\n\n"
+READ_SIZE = 65536
+QUEUE_SIZE = 64  # Événements en attente avant de bloquer les lectures, le script est alors freiné par le pipe
+BASH = shutil.which("bash") or "bash"  # Résolu une seule fois plutôt qu'à chaque lancement
+SCRIPT_NAME_RE = re.compile(r"\A[A-Za-z0-9_-]{1,64}\Z")  # Noms de scripts autorisés
+CHECK_FILE_PATH = '/home/laster13/seedbox-compose/ssddb'  # Chemin du fichier à vérifier
+CACHE_TTL = 60  # Durée de validité du cache des vérifications de fichiers, en secondes
 
 class ScriptModel(BaseModel):
     name: str
     params: List[str] = []
 
 
-@router.get("/check-file")
-async def check_file():
-    file_path = '/home/laster13/seedbox-compose/ssddb'  # Chemin du fichier à vérifier
-    
+def sse_frame(lines: bytes, prefix: bytes = SSE_PREFIX) -> bytes:
+    """Préfixer chaque ligne et construire un événement SSE."""
+    # Un \r seul termine aussi une ligne en SSE (barres de progression docker/curl/rsync)
+    lines = lines.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return prefix + lines.replace(b"\n", b"\n" + prefix) + SSE_SUFFIX
+
+
+def ttl_bucket() -> int:
+    """Clé de cache qui change toutes les `CACHE_TTL` secondes."""
+    return int(time.time() / CACHE_TTL)
+
+
+@lru_cache(maxsize=8)
+def available_scripts(scripts_dir: str, _bucket: int) -> frozenset:
+    """Noms des scripts présents dans `scripts_dir`, relus au plus une fois par période."""
     try:
-        # Vérification de l'existence du fichier
-        if os.path.exists(file_path):
-            return {"exists": True}  # Le fichier existe
-        else:
-            return {"exists": False}  # Le fichier n'existe pas
-    except Exception as e:
-        # Gestion des erreurs (par exemple, problème de permissions)
-        raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
+        return frozenset(f[:-3] for f in os.listdir(scripts_dir) if f.endswith(".sh"))
+    except OSError:
+        return frozenset()
+
 
+@lru_cache(maxsize=1)
+def file_exists(path: str, _bucket: int) -> bool:
+    """`os.path.exists` mis en cache pour la période courante."""
+    return os.path.exists(path)
 
-@router.get("/run/{script_name}")
-async def run_script(script_name: str, label: str = Query(None, description="Label du conteneur")):
-    # Validation du nom du script
-    if not script_name.isalnum():
-        raise HTTPException(status_code=400, detail="Nom de script invalide.")
 
-    # Chemin vers le script bash
-    script_path = os.path.join(SCRIPTS_DIR, f"{script_name}.sh")
-    
-    # Vérification de l'existence du script
-    if not os.path.isfile(script_path):
-        raise HTTPException(status_code=404, detail=f"Script non trouvé: {script_name}.sh")
+async def pump_frames(stream: asyncio.StreamReader, queue: asyncio.Queue, prefix: bytes):
+    """Lire un flux par gros blocs et pousser un événement SSE par bloc de lignes complètes."""
+    pending = b""
+    cancelled = False
+    try:
+        while chunk := await stream.read(READ_SIZE):
+            data = pending + chunk
+            # Un \r en fin de bloc peut être la première moitié d'un \r\n
+            carry = b"\r" if data.endswith(b"\r") else b""
+            data = data[:len(data) - len(carry)].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            lines, _, pending = data.rpartition(b"\n")
+            pending += carry
+            if lines:
+                await queue.put(sse_frame(lines, prefix))
+        # Un \r final termine simplement la dernière ligne
+        pending = pending.removesuffix(b"\r")
+        if pending:
+            await queue.put(sse_frame(pending, prefix))
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        # Signale la fin de ce flux, sauf après une annulation : plus personne ne lit la file
+        if not cancelled:
+            await queue.put(None)
+
+
+async def stream_process(argv: List[str]):
+    """Exécuter le script et streamer stdout et stderr entrelacés, dans l'ordre d'arrivée."""
+    process = None
+    # Références gardées pour que les tâches ne soient pas collectées en cours de route
+    pumps = []
+    try:
+        process = await asyncio.create_subprocess_exec(*argv, stdout=PIPE, stderr=PIPE)
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        pumps = [
+            asyncio.create_task(pump_frames(process.stdout, queue, SSE_PREFIX)),
+            asyncio.create_task(pump_frames(process.stderr, queue, SSE_ERROR_PREFIX)),
+        ]
+
+        remaining = len(pumps)
+        while remaining:
+            frame = await queue.get()
+            if frame is None:
+                remaining -= 1
+            else:
+                yield frame
 
-    # Fonction pour streamer les logs
-    def stream_logs():
+        await process.wait()
+        yield SSE_END
+    except Exception as e:
+        yield f"data: Erreur lors de l'exécution: {str(e)}\n\n".encode()
+    finally:
+        # Client déconnecté ou erreur : ne pas laisser tourner les lectures ni le script
+        for pump in pumps:
+            pump.cancel()
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            # Vider les pipes : un lecteur plein, laissé par les lectures annulées, bloquerait wait()
+            await process.communicate()
+
+
+def make_router(scripts_dir: str, prefix: str = "/scripts") -> APIRouter:
+    """Créer un router exposant les scripts Bash de `scripts_dir` sous `prefix`."""
+    router = APIRouter(
+        prefix=prefix,  # Toutes les routes seront préfixées par `prefix`
+        tags=["scripts"],
+        responses={404: {"description": "Not found"}},
+    )
+
+    @router.get("/check-file")
+    async def check_file():
         try:
-            # Si un label est fourni, on l'utilise comme argument du script
-            if label:
-                process = Popen(['bash', script_path, label], stdout=PIPE, stderr=PIPE, text=True)
+            # Vérification de l'existence du fichier
+            if file_exists(CHECK_FILE_PATH, ttl_bucket()):
+                return {"exists": True}  # Le fichier existe
             else:
-                # Si pas de label, on exécute le script sans paramètres
-                process = Popen(['bash', script_path], stdout=PIPE, stderr=PIPE, text=True)
+                return {"exists": False}  # Le fichier n'existe pas
+        except Exception as e:
+            # Gestion des erreurs (par exemple, problème de permissions)
+            raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
 
-            # Stream des logs du script
-            for line in process.stdout:
-                yield f"data: {line}\n\n"
-            for err in process.stderr:
-                yield f"data: Erreur: {err}\n\n"
+    @router.get("/run/{script_name}")
+    async def run_script(script_name: str, label: str = Query(None, description="Label du conteneur")):
+        # Validation du nom du script
+        if not SCRIPT_NAME_RE.match(script_name):
+            raise HTTPException(status_code=400, detail="Nom de script invalide.")
 
-            process.wait()
-            yield "event: end\ndata: Fin du script\n\n"
-        except Exception as e:
-            yield f"data: Erreur lors de l'exécution: {str(e)}\n\n"
-
-    # Retourne les logs en streaming
-    return StreamingResponse(stream_logs(), media_type="text/event-stream")
-
-
-@router.post("/run")
-async def run_script_with_params(script: ScriptModel):
-    if not script.name.isalnum():
-        raise HTTPException(status_code=400, detail="Nom de script invalide.")
-    script_path = os.path.join(SCRIPTS_DIR, f"{script.name}.sh")
-    if not os.path.isfile(script_path):
-        raise HTTPException(status_code=404, detail="Script non trouvé.")
-
-    def stream_logs():
-        process = Popen(['bash', script_path] + script.params, stdout=PIPE, stderr=PIPE, text=True)
-        for line in process.stdout:
-            yield f"data: {line}\n\n"
-        for err in process.stderr:
-            yield f"data: Erreur: {err}\n\n"
-        process.wait()
-        print("Script terminé, envoi de l'événement 'end'")
-        yield "event: end\ndata: Fin du script\n\n"
-
-    return StreamingResponse(stream_logs(), media_type="text/event-stream")
+        # Chemin vers le script bash
+        script_path = os.path.join(scripts_dir, f"{script_name}.sh")
+
+        # Vérification de l'existence du script
+        if script_name not in available_scripts(scripts_dir, ttl_bucket()):
+            raise HTTPException(status_code=404, detail=f"Script non trouvé: {script_name}.sh")
+
+        # Si un label est fourni, on l'utilise comme argument du script
+        if label:
+            argv = [BASH, script_path, label]
+        else:
+            # Si pas de label, on exécute le script sans paramètres
+            argv = [BASH, script_path]
+
+        # Retourne les logs en streaming
+        return StreamingResponse(stream_process(argv), media_type="text/event-stream")
+
+    @router.post("/run")
+    async def run_script_with_params(script: ScriptModel):
+        if not SCRIPT_NAME_RE.match(script.name):
+            raise HTTPException(status_code=400, detail="Nom de script invalide.")
+        script_path = os.path.join(scripts_dir, f"{script.name}.sh")
+        if script.name not in available_scripts(scripts_dir, ttl_bucket()):
+            raise HTTPException(status_code=404, detail="Script non trouvé.")
+
+        return StreamingResponse(stream_process([BASH, script_path, *script.params]), media_type="text/event-stream")
+
+    return router
+
+
+# Création du router pour les scripts Bash avec le préfixe `/scripts`
+router = make_router(SCRIPTS_DIR)
@@ -1,5 +1,8 @@
 """Mdblist content module"""
 
+import re
+import time
+from functools import lru_cache
 from typing import Generator
 
 from program.db.db_functions import _filter_existing_items
@@ -7,7 +10,12 @@ from program.media.item import MediaItem
 from program.settings.manager import settings_manager
 from utils.logger import logger
 from utils.ratelimiter import RateLimiter, RateLimitExceeded
-from utils.request import get, ping
+from utils.request import get, get_pooled_session, ping
+
+# Daily requests to requests per 2 minutes
+REQUEST_TIME_DIVISOR = 24 * 60 / 2
+# Free tier rate, used when the limits can't be fetched
+DEFAULT_REQUESTS_PER_2_MINUTES = 25.0
 
 
 class Mdblist:
@@ -33,16 +41,16 @@ class Mdblist:
         if not self.settings.lists:
             logger.error("Mdblist is enabled, but list is empty.")
             return False
-        response = ping(f"https://mdblist.com/api/user?apikey={self.settings.api_key}")
+        response = ping(f"https://mdblist.com/api/user?apikey={self.settings.api_key}", session=get_pooled_session("mdblist"))
         if "Invalid API key!" in response.response.text:
             logger.error("Mdblist api key is invalid.")
             return False
         return True
 
     def run(self) -> Generator[MediaItem, None, None]:
-        """Fetch media from mdblist and add them to media_items attribute
-        if they are not already there"""
-        items_to_yield = []
+        """Fetch media from mdblist and yield each new item as soon as
+        its list has been fetched"""
+        new_items_count = 0
         try:
             with self.rate_limiter:
                 for list in self.settings.lists:
@@ -53,49 +61,65 @@ class Mdblist:
                         items = list_items_by_id(list, self.settings.api_key)
                     else:
                         items = list_items_by_url(list, self.settings.api_key)
-                    for item in items:
-                        if hasattr(item, "error") or not item or item.imdb_id is None:
+                    list_items = [
+                        MediaItem({"imdb_id": item.imdb_id, "requested_by": self.key})
+                        for item in items
+                        if not hasattr(item, "error") and item and item.imdb_id is not None
+                        and item.imdb_id.startswith("tt") and item.imdb_id not in self.recurring_items
+                    ]
+                    for item in _filter_existing_items(list_items):
+                        # The same item can appear in several lists
+                        if item.imdb_id in self.recurring_items:
                             continue
-                        if item.imdb_id.startswith("tt"):
-                            items_to_yield.append(MediaItem(
-                                {"imdb_id": item.imdb_id, "requested_by": self.key}
-                            ))
+                        self.recurring_items.add(item.imdb_id)
+                        new_items_count += 1
+                        yield item
         except RateLimitExceeded:
             pass
 
-        non_existing_items = _filter_existing_items(items_to_yield)
-        new_non_recurring_items = [item for item in non_existing_items if item.imdb_id not in self.recurring_items and isinstance(item, MediaItem)]
-        self.recurring_items.update([item.imdb_id for item in new_non_recurring_items])
-
-        if new_non_recurring_items:
-            logger.info(f"Found {len(new_non_recurring_items)} new items to fetch")
-        yield new_non_recurring_items
+        if new_items_count:
+            logger.info(f"Found {new_items_count} new items to fetch")
 
     def _calculate_request_time(self):
-        limits = my_limits(self.settings.api_key).limits
-        daily_requests = limits.api_requests
-        return daily_requests / 24 / 60 * 2
+        try:
+            limits = _cached_limits(self.settings.api_key, int(time.time() / LIMITS_TTL)).limits
+            return limits.api_requests / REQUEST_TIME_DIVISOR
+        except Exception as e:
+            # Don't keep a failed lookup around for the whole TTL
+            _cached_limits.cache_clear()
+            logger.warning(f"Failed to fetch mdblist limits, using default of {DEFAULT_REQUESTS_PER_2_MINUTES}: {e}")
+            return DEFAULT_REQUESTS_PER_2_MINUTES
 
 
 # API METHODS
 
+LIMITS_TTL = 6 * 60 * 60
+# Trailing slashes and optional `/json` path segment of a list url
+_LIST_URL_SUFFIX = re.compile(r"(?:/json)?/*$")
+
 
 def my_limits(api_key: str):
     """Wrapper for mdblist api method 'My limits'"""
-    response = get(f"http://www.mdblist.com/api/user?apikey={api_key}")
+    response = get(f"http://www.mdblist.com/api/user?apikey={api_key}", session=get_pooled_session("mdblist"))
     return response.data
 
 
+@lru_cache(maxsize=8)
+def _cached_limits(api_key: str, _bucket: int):
+    """`my_limits` memoized per api key, refreshed every `LIMITS_TTL` seconds via `_bucket`"""
+    return my_limits(api_key)
+
+
 def list_items_by_id(list_id: int, api_key: str):
     """Wrapper for mdblist api method 'List items'"""
     response = get(
-        f"http://www.mdblist.com/api/lists/{str(list_id)}/items?apikey={api_key}"
+        f"http://www.mdblist.com/api/lists/{str(list_id)}/items?apikey={api_key}",
+        session=get_pooled_session("mdblist")
     )
     return response.data
 
 
 def list_items_by_url(url: str, api_key: str):
-    url = url if url.endswith("/") else f"{url}/"
-    url = url if url.endswith("json/") else f"{url}json/"
-    response = get(url, params={"apikey": api_key})
+    url = _LIST_URL_SUFFIX.sub("/json/", url, count=1)
+    response = get(url, params={"apikey": api_key}, session=get_pooled_session("mdblist"))
     return response.data
\ No newline at end of file
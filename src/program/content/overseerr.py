@@ -1,6 +1,7 @@
 """Overseerr content module"""
 
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Generator, Union
 
 from requests.exceptions import ConnectionError, RetryError
 from urllib3.exceptions import MaxRetryError, NewConnectionError
@@ -10,12 +11,23 @@ from program.indexers.trakt import get_imdbid_from_tmdb
 from program.media.item import MediaItem
 from program.settings.manager import settings_manager
 from utils.logger import logger
-from utils.request import delete, get, ping, post
+from utils.request import (
+    delete,
+    get,
+    get_pooled_session,
+    ping,
+    ping_recently_succeeded,
+    post,
+    remember_successful_ping,
+)
 
 
 class Overseerr:
     """Content class for overseerr"""
 
+    REQUESTS_PAGE_SIZE = 200
+    EXISTING_CHECK_BATCH_SIZE = 50
+
     def __init__(self):
         self.key = "overseerr"
         self.settings = settings_manager.settings.content.overseerr
@@ -25,25 +37,35 @@ class Overseerr:
         if not self.initialized:
             return
         self.recurring_items: set[str] = set()
+        # Newest request update handled so far, with every older request handled too.
+        # Later polls stop once they reach it
+        self._last_seen_modified_ts: Union[str, None] = None
+        self._imdb_id_cache: dict[tuple[str, int], str] = {}
         logger.success("Overseerr initialized!")
 
     def validate(self) -> bool:
         if not self.settings.enabled:
             return False
-        if self.settings.api_key == "" or len(self.settings.api_key) != 68:
+        api_key = self.settings.api_key
+        if len(api_key) != 68:
             logger.error("Overseerr api key is not set.")
             return False
+        if ping_recently_succeeded(self.key, self.settings.url, api_key):
+            return True
         try:
             response = ping(
                 self.settings.url + "/api/v1/auth/me",
                 additional_headers=self.headers,
                 timeout=30,
+                session=get_pooled_session("overseerr"),
             )
             if response.status_code >= 201:
                 logger.error(
                     f"Overseerr ping failed - Status Code: {response.status_code}, Reason: {response.response.reason}"
                 )
                 return False
+            if response.is_ok:
+                remember_successful_ping(self.key, self.settings.url, api_key)
             return response.is_ok
         except (ConnectionError, RetryError, MaxRetryError, NewConnectionError):
             logger.error("Overseerr URL is not reachable, or it timed out")
@@ -52,58 +74,119 @@ class Overseerr:
             logger.error(f"Unexpected error during Overseerr validation: {str(e)}")
             return False
 
-    def run(self):
-        """Fetch new media from `Overseerr`"""
+    def run(self) -> Generator[MediaItem, None, None]:
+        """Fetch new media from `Overseerr`, yielding new items batch by batch as they are resolved"""
         if self.settings.use_webhook and self.run_once:
             return
 
-        overseerr_items: list[MediaItem] = self.get_media_requests()
-        non_existing_items = _filter_existing_items(overseerr_items)
-        new_non_recurring_items = [item for item in non_existing_items if item.imdb_id not in self.recurring_items and isinstance(item, MediaItem)]
-        self.recurring_items.update([item.imdb_id for item in new_non_recurring_items])
+        new_items_count = 0
+        batch: list[MediaItem] = []
+        for item in self.get_media_requests():
+            if not item.imdb_id or item.imdb_id in self.recurring_items:
+                continue
+            batch.append(item)
+            # Check resolved items against the database in batches rather than one query per item
+            if len(batch) >= self.EXISTING_CHECK_BATCH_SIZE:
+                for new_item in self._new_items(batch):
+                    new_items_count += 1
+                    yield new_item
+                batch = []
+        for new_item in self._new_items(batch):
+            new_items_count += 1
+            yield new_item
 
         if self.settings.use_webhook:
             logger.debug("Webhook is enabled. Running Overseerr once before switching to webhook only mode")
             self.run_once = True
 
-        if new_non_recurring_items:
-            logger.info(f"Fetched {len(new_non_recurring_items)} new items from Overseerr")
+        if new_items_count:
+            logger.info(f"Fetched {new_items_count} new items from Overseerr")
 
-        yield new_non_recurring_items
+    def _new_items(self, items: list[MediaItem]) -> Generator[MediaItem, None, None]:
+        """Yield the items of `items` that are neither in the database nor already handed out"""
+        if not items:
+            return
+        for item in _filter_existing_items(items):
+            # The same item can be requested more than once
+            if item.imdb_id in self.recurring_items:
+                continue
+            self.recurring_items.add(item.imdb_id)
+            yield item
 
-    def get_media_requests(self) -> list[MediaItem]:
+    def get_media_requests(self) -> Generator[MediaItem, None, None]:
         """Get media requests from `Overseerr`"""
-        try:
-            response = get(self.settings.url + f"/api/v1/request?take={10000}&filter=approved&sort=added", additional_headers=self.headers)
-            if not response.is_ok:
-                logger.error(f"Failed to fetch requests from overseerr: {response.data}")
-                return []
-        except (ConnectionError, RetryError, MaxRetryError) as e:
-            logger.error(f"Failed to fetch requests from overseerr: {str(e)}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error during fetching requests: {str(e)}")
-            return []
-
-        if not hasattr(response.data, "pageInfo") or getattr(response.data.pageInfo, "results", 0) == 0:
-            return []
+        media_requests, complete = self._fetch_new_requests()
+        # Requests that may still need handling on a later poll, the watermark must stay below them
+        unresolved_ts = [request.updatedAt for request in media_requests if request.media.status < 3]
 
+        # Resolve imdb ids concurrently and hand out each item as soon as its lookup is done.
         # Lets look at approved items only that are only in the pending state
-        pending_items = [
-            item for item in response.data.results
-            if item.status == 2 and item.media.status == 3
-        ]
-
-        return [
-            MediaItem({
-                "imdb_id": self.get_imdb_id(item.media),
-                "requested_by": self.key,
-                "overseerr_id": item.media.id,
-                "requested_id": item.id
-            })
-            for item in pending_items
-        ]
+        with ThreadPoolExecutor(thread_name_prefix="Overseerr", max_workers=8) as executor:
+            futures = {
+                executor.submit(self.get_imdb_id, request.media): request
+                for request in media_requests
+                if request.status == 2 and request.media.status == 3
+            }
+            for future in as_completed(futures):
+                request = futures[future]
+                imdb_id = future.result()
+                if not imdb_id:
+                    unresolved_ts.append(request.updatedAt)
+                yield MediaItem({
+                    "imdb_id": imdb_id,
+                    "requested_by": self.key,
+                    "overseerr_id": request.media.id,
+                    "requested_id": request.id
+                })
 
+        if complete:
+            self._advance_watermark(media_requests, unresolved_ts)
+
+    def _fetch_new_requests(self) -> tuple[list, bool]:
+        """Page through approved requests, newest update first, until the watermark of a previous poll.
+
+        Returns the requests fetched and whether every page could be fetched.
+        """
+        media_requests = []
+        skip = 0
+        while True:
+            try:
+                response = get(
+                    self.settings.url + f"/api/v1/request?take={self.REQUESTS_PAGE_SIZE}&skip={skip}&filter=approved&sort=modified",
+                    additional_headers=self.headers,
+                    session=get_pooled_session("overseerr"),
+                )
+                if not response.is_ok:
+                    logger.error(f"Failed to fetch requests from overseerr: {response.data}")
+                    return media_requests, False
+            except (ConnectionError, RetryError, MaxRetryError) as e:
+                logger.error(f"Failed to fetch requests from overseerr: {str(e)}")
+                return media_requests, False
+            except Exception as e:
+                logger.error(f"Unexpected error during fetching requests: {str(e)}")
+                return media_requests, False
+
+            if not hasattr(response.data, "pageInfo") or getattr(response.data.pageInfo, "results", 0) == 0:
+                return media_requests, True
+
+            for request in response.data.results:
+                if self._last_seen_modified_ts and request.updatedAt <= self._last_seen_modified_ts:
+                    return media_requests, True
+                media_requests.append(request)
+
+            if response.data.pageInfo.page >= response.data.pageInfo.pages:
+                return media_requests, True
+            skip += self.REQUESTS_PAGE_SIZE
+
+    def _advance_watermark(self, media_requests: list, unresolved_ts: list[str]) -> None:
+        """Move the watermark to the newest request handled, but never past one that is still unresolved"""
+        if unresolved_ts:
+            oldest_unresolved = min(unresolved_ts)
+            handled_ts = [request.updatedAt for request in media_requests if request.updatedAt < oldest_unresolved]
+        else:
+            handled_ts = [request.updatedAt for request in media_requests]
+        if handled_ts:
+            self._last_seen_modified_ts = max(handled_ts)
 
     def get_imdb_id(self, data) -> str:
         """Get imdbId for item from overseerr"""
@@ -113,10 +196,22 @@ class Overseerr:
         else:
             external_id = data.tmdbId
 
+        # The mapping never changes, so only resolve each id once
+        cache_key = (data.mediaType, external_id)
+        imdb_id = self._imdb_id_cache.get(cache_key)
+        if imdb_id is None:
+            imdb_id = self._fetch_imdb_id(data.mediaType, external_id)
+            if imdb_id:
+                self._imdb_id_cache[cache_key] = imdb_id
+        return imdb_id
+
+    def _fetch_imdb_id(self, media_type: str, external_id: int) -> Union[str, None]:
+        """Fetch imdbId for a tmdb/tvdb id from overseerr"""
         try:
             response = get(
-                self.settings.url + f"/api/v1/{data.mediaType}/{external_id}?language=en",
+                self.settings.url + f"/api/v1/{media_type}/{external_id}?language=en",
                 additional_headers=self.headers,
+                session=get_pooled_session("overseerr"),
             )
         except (ConnectionError, RetryError, MaxRetryError) as e:
             logger.error(f"Failed to fetch media details from overseerr: {str(e)}")
@@ -137,7 +232,7 @@ class Overseerr:
         for id_attr, fetcher in alternate_ids:
             external_id_value = getattr(response.data.externalIds, id_attr, None)
             if external_id_value:
-                _type = data.media_type
+                _type = media_type
                 if _type == "tv":
                     _type = "show"
                 try:
@@ -158,6 +253,7 @@ class Overseerr:
             response = delete(
                 settings.url + f"/api/v1/request/{mediaId}",
                 additional_headers=headers,
+                session=get_pooled_session("overseerr", retry_if_failed=False),
             )
             logger.debug(f"Deleted request {mediaId} from overseerr")
             return response.is_ok == True
@@ -175,6 +271,7 @@ class Overseerr:
                 settings.url + f"/api/v1/media/{mediaId}/pending",
                 additional_headers=headers,
                 data={"is4k": False},
+                session=get_pooled_session("overseerr", retry_if_failed=False),
             )
             logger.info(f"Marked media {mediaId} as processing in overseerr")
             return response.is_ok
@@ -192,6 +289,7 @@ class Overseerr:
                 settings.url + f"/api/v1/media/{mediaId}/partial",
                 additional_headers=headers,
                 data={"is4k": False},
+                session=get_pooled_session("overseerr", retry_if_failed=False),
             )
             logger.info(f"Marked media {mediaId} as partially available in overseerr")
             return response.is_ok
@@ -209,6 +307,7 @@ class Overseerr:
                 settings.url + f"/api/v1/media/{mediaId}/available",
                 additional_headers=headers,
                 data={"is4k": False},
+                session=get_pooled_session("overseerr", retry_if_failed=False),
             )
             logger.info(f"Marked media {mediaId} as completed in overseerr")
             return response.is_ok
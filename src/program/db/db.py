@@ -30,8 +30,7 @@ db = SQLAlchemy(settings_manager.settings.database.host, engine_options=engine_o
 script_location = data_dir_path / "alembic/"
 
 
-if not os.path.exists(script_location):
-    os.makedirs(script_location)
+os.makedirs(script_location, exist_ok=True)
 
 alembic = Alembic(db, script_location)
 alembic.init(script_location)
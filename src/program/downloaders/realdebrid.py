@@ -1,3 +1,4 @@
+import heapq
 from datetime import datetime
 
 from loguru import logger
@@ -9,6 +10,14 @@ from utils.ratelimiter import RateLimiter
 from .shared import VIDEO_EXTENSIONS, FileFinder, premium_days_left
 
 BASE_URL = "https://api.real-debrid.com/rest/1.0"
+INSTANT_AVAILABILITY_CHUNK_SIZE = 40
+_MAGNET_PREFIX = "magnet:?xt=urn:btih:"
+
+# Suffixes checked in a single endswith call per file
+_VIDEO_EXT_TUPLE = tuple(f".{ext}" for ext in VIDEO_EXTENSIONS)
+
+# Torrent ids of the magnets added during this run, by lowercase infohash
+_added_torrents: dict[str, str] = {}
 
 torrent_limiter = RateLimiter(1, 1)
 overall_limiter = RateLimiter(60, 60)
@@ -81,21 +90,11 @@ class RealDebridDownloader:
                 containers = data.get("rd", [])
             else:
                 containers = []
-            # We avoid compressed downloads this way
-            def all_files_valid(file_dict: dict) -> bool:
-                return all(
-                    any(
-                        file["filename"].endswith(f".{ext}") and "sample" not in file["filename"].lower()
-                        for ext in VIDEO_EXTENSIONS
-                    )
-                    for file in file_dict.values()
-                )
-            # Sort the container to have the longest length first
-            containers.sort(key=lambda x: len(x), reverse=True)
-            for container in containers:
+            # Walk the containers longest first, stopping as soon as one matches
+            for container in _largest_first(containers):
                 if break_pointer[1] and break_pointer[0]:
                     break
-                if all_files_valid(container):
+                if _contains_valid_video_files(container):
                     cached_containers[infohash] = self.file_finder.get_cached_container(needed_media, break_pointer, container)
                     if cached_containers[infohash]:
                         break_pointer[0] = True
@@ -112,6 +111,25 @@ class RealDebridDownloader:
         if id:
             delete_torrent(id)
 
+def _largest_first(containers: list[dict]):
+    """Yield containers by descending file count, ties kept in original order.
+
+    Heapify is linear and each pop is logarithmic, so breaking after the
+    first match avoids the cost of a full sort.
+    """
+    heap = [(-len(container), index, container) for index, container in enumerate(containers)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+def _contains_valid_video_files(container: dict) -> bool:
+    """Check that every file of a container is a non-sample video, we avoid compressed downloads this way"""
+    for file in container.values():
+        filename = file["filename"].lower()
+        if not filename.endswith(_VIDEO_EXT_TUPLE) or "sample" in filename:
+            return False
+    return True
+
 def get(url):
     return request.get(
         url=f"{BASE_URL}/{url}",
@@ -119,7 +137,8 @@ def get(url):
         response_type=dict,
         specific_rate_limiter=torrent_limiter,
         overall_rate_limiter=overall_limiter,
-        proxies=settings.settings.downloaders.real_debrid.proxy_url if settings.settings.downloaders.real_debrid.proxy_enabled else None
+        proxies=settings.settings.downloaders.real_debrid.proxy_url if settings.settings.downloaders.real_debrid.proxy_enabled else None,
+        session=request.get_pooled_session("realdebrid")
     ).data
 
 def post(url, data):
@@ -130,7 +149,8 @@ def post(url, data):
         additional_headers={"Authorization": f"Bearer {settings.settings.downloaders.real_debrid.api_key}"},
         specific_rate_limiter=torrent_limiter,
         overall_rate_limiter=overall_limiter,
-        proxies=settings.settings.downloaders.real_debrid.proxy_url if settings.settings.downloaders.real_debrid.proxy_enabled else None
+        proxies=settings.settings.downloaders.real_debrid.proxy_url if settings.settings.downloaders.real_debrid.proxy_enabled else None,
+        session=request.get_pooled_session("realdebrid", retry_if_failed=False)
     ).data
 
 def delete(url):
@@ -141,12 +161,17 @@ def delete(url):
         response_type=dict,
         specific_rate_limiter=torrent_limiter,
         overall_rate_limiter=overall_limiter,
-        proxies=settings.settings.downloaders.real_debrid.proxy_url if settings.settings.downloaders.real_debrid.proxy_enabled else None
+        proxies=settings.settings.downloaders.real_debrid.proxy_url if settings.settings.downloaders.real_debrid.proxy_enabled else None,
+        session=request.get_pooled_session("realdebrid", retry_if_failed=False)
     ).data
 
 def add_torrent(infohash: str) -> int:
+    infohash = infohash.lower()
+    if infohash in _added_torrents:
+        return _added_torrents[infohash]
     try:
-        id = post("torrents/addMagnet", data={"magnet": f"magnet:?xt=urn:btih:{infohash}"})["id"]
+        id = post("torrents/addMagnet", data={"magnet": _MAGNET_PREFIX + infohash})["id"]
+        _added_torrents[infohash] = id
     except:
         logger.warning(f"Failed to add torrent with infohash {infohash}")
         id = None
@@ -160,16 +185,25 @@ def add_torrent_magnet(magnet: str) -> str:
         id = None
     return id
 
+def _forget_torrent(id: str):
+    """Drop `id` from the added torrents, so its magnet gets added again next time"""
+    for infohash_key, torrent_id in list(_added_torrents.items()):
+        if torrent_id == id:
+            del _added_torrents[infohash_key]
+
 def select_files(id: str, files: list[str]):
     try:
         post(f"torrents/selectFiles/{id}", data={"files": ",".join(files)})
     except:
+        # The torrent may have been removed or expired on Real-Debrid's side
+        _forget_torrent(id)
         logger.warning(f"Failed to select files for torrent with id {id}")
 
 def torrent_info(id: str) -> dict:
     try:
         info = get(f"torrents/info/{id}")
     except:
+        _forget_torrent(id)
         logger.warning(f"Failed to get info for torrent with id {id}")
         info = {}
     return info
@@ -183,16 +217,28 @@ def get_torrents(limit: int) -> list[dict]:
     return torrents
 
 def get_instant_availability(infohashes: list[str]) -> dict:
-    try:
-        data = get(f"torrents/instantAvailability/{'/'.join(infohashes)}")
-        if isinstance(data, list):
-            data = {}
-    except:
-        logger.warning("Failed to get instant availability.")
-        data = {}
-    return data
+    # Query each hash once, in canonical lowercase form
+    unique_hashes = list(dict.fromkeys(infohash.lower() for infohash in infohashes))
+    if not unique_hashes:
+        return {}
+    data = {}
+    # Keep request urls bounded and let one failing chunk not void the others
+    for i in range(0, len(unique_hashes), INSTANT_AVAILABILITY_CHUNK_SIZE):
+        chunk = unique_hashes[i:i + INSTANT_AVAILABILITY_CHUNK_SIZE]
+        try:
+            chunk_data = get(f"torrents/instantAvailability/{'/'.join(chunk)}")
+        except:
+            logger.warning("Failed to get instant availability.")
+            continue
+        # An empty list is returned when none of the hashes are known
+        if isinstance(chunk_data, dict):
+            data.update(chunk_data)
+    # Key the results by the hashes as the caller spelled them
+    return {infohash: data[infohash.lower()] for infohash in infohashes if infohash.lower() in data}
 
 def delete_torrent(id):
+    # A deleted torrent has to be added again next time
+    _forget_torrent(id)
     try:
         delete(f"torrents/delete/{id}")
     except:
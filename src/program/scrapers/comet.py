@@ -13,6 +13,8 @@ from program.scrapers.shared import _get_stremio_identifier
 from utils.logger import logger
 from utils.request import RateLimiter, RateLimitExceeded, get, ping
 
+INFOHASH_PATTERN = regex.compile(r"(?!.*playback\/)[a-zA-Z0-9]{40}")
+
 
 class Comet:
     """Scraper for `Comet`"""
@@ -104,8 +106,7 @@ class Comet:
                 logger.error("Invalid Comet config.")
                 return {}
 
-            infohash_pattern = regex.compile(r"(?!.*playback\/)[a-zA-Z0-9]{40}")
-            infohash = infohash_pattern.search(stream.url).group()
+            infohash = INFOHASH_PATTERN.search(stream.url).group()
             title = stream.title.split("\n")[0]
 
             if not infohash:
@@ -37,8 +37,13 @@ def _parse_results(item: MediaItem, results: Dict[str, str], log_msg: bool = Tru
     torrents: Set[Torrent] = set()
     processed_infohashes: Set[str] = set()
     correct_title: str = item.get_top_title()
+    # Resolved once per call rather than once per result
+    log_string: str = item.log_string
+    remove_trash: bool = settings_manager.settings.ranking.options["remove_all_trash"]
+    aliases: dict = item.get_aliases() if enable_aliases else {}  # in some cases we want to disable aliases
+    parse_debug: bool = settings_manager.settings.scraping.parse_debug
 
-    logger.log("SCRAPER", f"Processing {len(results)} results for {item.log_string}")
+    logger.log("SCRAPER", f"Processing {len(results)} results for {log_string}")
 
     if item.type in ["show", "season", "episode"]:
         needed_seasons: list[int] = _get_needed_seasons(item)
@@ -52,15 +57,15 @@ def _parse_results(item: MediaItem, results: Dict[str, str], log_msg: bool = Tru
                 raw_title=raw_title,
                 infohash=infohash,
                 correct_title=correct_title,
-                remove_trash=settings_manager.settings.ranking.options["remove_all_trash"],
-                aliases=item.get_aliases() if enable_aliases else {}  # in some cases we want to disable aliases
+                remove_trash=remove_trash,
+                aliases=aliases
             )
 
 
             if torrent.data.country and not item.is_anime:
                 if _get_item_country(item) != torrent.data.country:
-                    if settings_manager.settings.scraping.parse_debug:
-                        logger.debug(f"Skipping torrent for incorrect country with {item.log_string}: {raw_title}")
+                    if parse_debug:
+                        logger.debug(f"Skipping torrent for incorrect country with {log_string}: {raw_title}")
                     continue
 
             if item.type in ["show", "season", "episode"]:
@@ -114,16 +119,16 @@ def _parse_results(item: MediaItem, results: Dict[str, str], log_msg: bool = Tru
             # The only stuff I've seen that show up here is titles with a date.
             # Dates can be sometimes parsed incorrectly by Arrow library,
             # so we'll just ignore them.
-            if settings_manager.settings.scraping.parse_debug and log_msg:
+            if parse_debug and log_msg:
                 logger.debug(f"Skipping torrent: '{raw_title}' - {e}")
             continue
         except GarbageTorrent as e:
-            if settings_manager.settings.scraping.parse_debug and log_msg:
-                logger.debug(f"Trashing torrent for {item.log_string}: '{raw_title}'")
+            if parse_debug and log_msg:
+                logger.debug(f"Trashing torrent for {log_string}: '{raw_title}'")
             continue
 
     if torrents:
-        logger.log("SCRAPER", f"Processed {len(torrents)} matches for {item.log_string}")
+        logger.log("SCRAPER", f"Processed {len(torrents)} matches for {log_string}")
         torrents = sort_torrents(torrents)
         torrents_dict = {}
         for torrent in torrents.values():
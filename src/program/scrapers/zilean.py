@@ -5,12 +5,25 @@ from typing import Dict
 from requests import ConnectTimeout, ReadTimeout
 from requests.exceptions import RequestException
 
-from program.media.item import Episode, MediaItem, Season, Show
+from program.media.item import MediaItem
 from program.settings.manager import settings_manager
 from program.settings.models import AppModel
 from utils.logger import logger
 from utils.ratelimiter import RateLimiter, RateLimitExceeded
-from utils.request import get, ping
+from utils.request import (
+    get,
+    get_pooled_session,
+    ping,
+    ping_recently_succeeded,
+    remember_successful_ping,
+)
+
+# Season/episode query params by item type, movies need none
+_SEASON_PARAMS = {
+    "show": lambda item: {"Season": 1},
+    "season": lambda item: {"Season": item.number},
+    "episode": lambda item: {"Season": item.parent.number, "Episode": item.number},
+}
 
 
 class Zilean:
@@ -20,6 +33,7 @@ class Zilean:
         self.key = "zilean"
         self.settings = settings_manager.settings.scraping.zilean
         self.timeout = self.settings.timeout
+        self.scrape_url = f"{self.settings.url}/dmm/filtered"
         self.rate_limiter = None
         self.initialized = self.validate()
         if not self.initialized:
@@ -37,9 +51,13 @@ class Zilean:
         if not isinstance(self.timeout, int) or self.timeout <= 0:
             logger.error("Zilean timeout is not set or invalid.")
             return False
+        if ping_recently_succeeded(self.key, self.settings.url):
+            return True
         try:
             url = f"{self.settings.url}/healthchecks/ping"
-            response = ping(url=url, timeout=self.timeout, specific_rate_limiter=self.rate_limiter)
+            response = ping(url=url, timeout=self.timeout, specific_rate_limiter=self.rate_limiter, session=get_pooled_session(self.key))
+            if response.is_ok:
+                remember_successful_ping(self.key, self.settings.url)
             return response.is_ok
         except Exception as e:
             logger.error(f"Zilean failed to initialize: {e}")
@@ -58,31 +76,26 @@ class Zilean:
     def _build_query_params(self, item: MediaItem) -> Dict[str, str]:
         """Build the query params for the Zilean API"""
         params = {"Query": item.get_top_title()}
-        if isinstance(item, MediaItem) and hasattr(item, "year"):
+        if hasattr(item, "year"):
             params["Year"] = item.year
-        if isinstance(item, Show):
-            params["Season"] = 1
-        elif isinstance(item, Season):
-            params["Season"] = item.number
-        elif isinstance(item, Episode):
-            params["Season"] = item.parent.number
-            params["Episode"] = item.number
+        season_params = _SEASON_PARAMS.get(item.type)
+        if season_params:
+            params.update(season_params(item))
         return params
 
     def scrape(self, item: MediaItem) -> Dict[str, str]:
         """Wrapper for `Zilean` scrape method"""
-        url = f"{self.settings.url}/dmm/filtered"
         params = self._build_query_params(item)
 
-        response = get(url, params=params, timeout=self.timeout, specific_rate_limiter=self.rate_limiter)
+        response = get(self.scrape_url, params=params, timeout=self.timeout, response_type=dict, specific_rate_limiter=self.rate_limiter, session=get_pooled_session(self.key))
         if not response.is_ok or not response.data:
             return {}
 
-        torrents: Dict[str, str] = {}
-        for result in response.data:
-            if not result.raw_title or not result.info_hash:
-                continue
-            torrents[result.info_hash] = result.raw_title
+        torrents: Dict[str, str] = {
+            result["info_hash"]: result["raw_title"]
+            for result in response.data
+            if result.get("info_hash") and result.get("raw_title")
+        }
 
         if torrents:
             logger.log("SCRAPER", f"Found {len(torrents)} streams for {item.log_string}")
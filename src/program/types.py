@@ -1,34 +1,37 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Generator, Union
+from typing import TYPE_CHECKING, Generator, TypeAlias, Union
 
-from program.content import Listrr, Mdblist, Overseerr, PlexWatchlist, TraktContent
-from program.downloaders import (
-    AllDebridDownloader,
-    RealDebridDownloader,
-    TorBoxDownloader,
-)
-from program.libraries import SymlinkLibrary
 from program.media.item import MediaItem
-from program.scrapers import (
-    Annatar,
-    Jackett,
-    Knightcrawler,
-    Mediafusion,
-    Orionoid,
-    Scraping,
-    Torrentio,
-    Zilean,
-)
-from program.scrapers.torbox import TorBoxScraper
-from program.symlink import Symlinker
-from program.updaters import Updater
+
+# Only needed for the typehints below, importing them eagerly would load every service module
+if TYPE_CHECKING:
+    from program.content import Listrr, Mdblist, Overseerr, PlexWatchlist, TraktContent
+    from program.downloaders import (
+        AllDebridDownloader,
+        RealDebridDownloader,
+        TorBoxDownloader,
+    )
+    from program.libraries import SymlinkLibrary
+    from program.scrapers import (
+        Annatar,
+        Jackett,
+        Knightcrawler,
+        Mediafusion,
+        Orionoid,
+        Scraping,
+        Torrentio,
+        Zilean,
+    )
+    from program.scrapers.torbox import TorBoxScraper
+    from program.symlink import Symlinker
+    from program.updaters import Updater
 
 # Typehint classes
-Scraper = Union[Scraping, Torrentio, Knightcrawler, Mediafusion, Orionoid, Jackett, Annatar, TorBoxScraper, Zilean]
-Content = Union[Overseerr, PlexWatchlist, Listrr, Mdblist, TraktContent]
-Downloader = Union[RealDebridDownloader, TorBoxDownloader, AllDebridDownloader]
-Service = Union[Content, SymlinkLibrary, Scraper, Downloader, Symlinker, Updater]
+Scraper: TypeAlias = "Union[Scraping, Torrentio, Knightcrawler, Mediafusion, Orionoid, Jackett, Annatar, TorBoxScraper, Zilean]"
+Content: TypeAlias = "Union[Overseerr, PlexWatchlist, Listrr, Mdblist, TraktContent]"
+Downloader: TypeAlias = "Union[RealDebridDownloader, TorBoxDownloader, AllDebridDownloader]"
+Service: TypeAlias = "Union[Content, SymlinkLibrary, Scraper, Downloader, Symlinker, Updater]"
 MediaItemGenerator = Generator[MediaItem, None, MediaItem | None]
 
 class ProcessedEvent:
@@ -41,4 +44,4 @@ class ProcessedEvent:
 class Event:
     emitted_by: Service
     item: MediaItem
-    run_at: datetime = datetime.now()
\ No newline at end of file
+    run_at: datetime = field(default_factory=datetime.now)
\ No newline at end of file
@@ -1,14 +1,22 @@
 """Emby Updater module"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from types import SimpleNamespace
 from typing import Generator
 
+from cachetools import TTLCache
+
 from program.settings.manager import settings_manager
 from program.media.item import MediaItem
-from utils.request import get, post
+from utils.request import get, get_pooled_session, ping_recently_succeeded, post, remember_successful_ping
 from utils.logger import logger
 
 
 class EmbyUpdater:
+    # Library listings per (url, api key), shared by every instance
+    _libraries = TTLCache(maxsize=8, ttl=5 * 60)
+    _libraries_lock = Lock()
+
     def __init__(self):
         self.key = "emby"
         self.initialized = False
@@ -28,9 +36,12 @@ class EmbyUpdater:
         if not self.settings.url:
             logger.error("Emby URL is not set!")
             return False
+        if ping_recently_succeeded(self.key, self.settings.url, self.settings.api_key):
+            return True
         try:
-            response = get(f"{self.settings.url}/Users?api_key={self.settings.api_key}")
+            response = get(f"{self.settings.url}/Users?api_key={self.settings.api_key}", session=get_pooled_session(self.key))
             if response.is_ok:
+                remember_successful_ping(self.key, self.settings.url, self.settings.api_key)
                 self.initialized = True
                 return True
         except Exception as e:
@@ -56,10 +67,16 @@ class EmbyUpdater:
         updated = False
         updated_episodes = []
 
-        for item_to_update in items_to_update:
-            if self.update_item(item_to_update):
-                updated_episodes.append(item_to_update)
-                updated = True
+        # Emby accepts every path of a show/season in one call, only fall back to per item updates on failure
+        eligible = [i for i in items_to_update if i.symlinked and i.update_folder != "updated" and i.symlink_path]
+        if eligible and self.update_items(eligible):
+            updated_episodes = eligible
+            updated = True
+        elif len(eligible) > 1:
+            with ThreadPoolExecutor(thread_name_prefix="Emby", max_workers=8) as executor:
+                results = list(executor.map(self.update_item, eligible))
+            updated_episodes = [e for e, ok in zip(eligible, results) if ok]
+            updated = bool(updated_episodes)
 
         if updated:
             if item.type in ["show", "season"]:
@@ -77,27 +94,41 @@ class EmbyUpdater:
     def update_item(self, item: MediaItem) -> bool:
         """Update the Emby item"""
         if item.symlinked and item.update_folder != "updated" and item.symlink_path:
-            try:
-                response = post(
-                    f"{self.settings.url}/Library/Media/Updated",
-                    json={"Updates": [{"Path": item.symlink_path, "UpdateType": "Created"}]},
-                    params={"api_key": self.settings.api_key},
-                )
-                if response.is_ok:
-                    return True
-            except Exception as e:
-                logger.error(f"Failed to update Emby item: {e}")
+            return self.update_items([item])
+        return False
+
+    def update_items(self, items: list[MediaItem]) -> bool:
+        """Notify Emby of the symlinks of all `items` in a single request"""
+        try:
+            response = post(
+                f"{self.settings.url}/Library/Media/Updated",
+                json={"Updates": [{"Path": item.symlink_path, "UpdateType": "Created"} for item in items]},
+                params={"api_key": self.settings.api_key},
+                session=get_pooled_session(self.key, retry_if_failed=False),
+            )
+            if response.is_ok:
+                return True
+        except Exception as e:
+            logger.error(f"Failed to update Emby items: {e}")
         return False
 
     # not needed to update, but maybe useful in the future?
     def get_libraries(self) -> list[SimpleNamespace]:
         """Get the libraries from Emby"""
+        cache_key = (self.settings.url, self.settings.api_key)
+        with EmbyUpdater._libraries_lock:
+            cached = EmbyUpdater._libraries.get(cache_key)
+        if cached is not None:
+            return list(cached)
         try:
             response = get(
                 f"{self.settings.url}/Library/VirtualFolders",
                 params={"api_key": self.settings.api_key},
+                session=get_pooled_session(self.key),
             )
             if response.is_ok and response.data:
+                with EmbyUpdater._libraries_lock:
+                    EmbyUpdater._libraries[cache_key] = list(response.data)
                 return response.data
         except Exception as e:
             logger.error(f"Failed to get Emby libraries: {e}")
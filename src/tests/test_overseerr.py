@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from program.content import overseerr
+from program.content.overseerr import Overseerr
+from program.settings.manager import settings_manager as settings
+
+
+def make_request(request_id, updated_at, media_status=3):
+    return SimpleNamespace(
+        id=request_id,
+        status=2,
+        updatedAt=updated_at,
+        media=SimpleNamespace(id=request_id, status=media_status, mediaType="movie", tmdbId=request_id, tvdbId=None),
+    )
+
+
+@pytest.fixture
+def requests_list():
+    """Approved requests as served by the mocked api, newest update first"""
+    return [make_request(i, f"2024-01-{10 - i:02d}T00:00:00.000Z") for i in range(1, 6)]
+
+
+@pytest.fixture
+def api_calls():
+    return []
+
+
+@pytest.fixture
+def content(monkeypatch, requests_list, api_calls):
+    """Instance of Overseerr with API and database calls mocked"""
+    def get(url, **kwargs):
+        query = parse_qs(urlparse(url).query)
+        take, skip = int(query["take"][0]), int(query["skip"][0])
+        api_calls.append(skip)
+        page = requests_list[skip:skip + take]
+        pages = max(1, -(-len(requests_list) // take))
+        return SimpleNamespace(is_ok=True, data=SimpleNamespace(
+            pageInfo=SimpleNamespace(page=skip // take + 1, pages=pages, results=len(requests_list)),
+            results=page,
+        ))
+
+    monkeypatch.setattr(overseerr, "ping", lambda *args, **kwargs: SimpleNamespace(status_code=200, is_ok=True))
+    monkeypatch.setattr(overseerr, "get", get)
+    monkeypatch.setattr(overseerr, "_filter_existing_items", lambda items: items)
+    monkeypatch.setattr(Overseerr, "REQUESTS_PAGE_SIZE", 2)
+
+    overseerr_settings = settings.settings.content.overseerr
+    monkeypatch.setattr(overseerr_settings, "enabled", True)
+    monkeypatch.setattr(overseerr_settings, "api_key", "k" * 68)
+    monkeypatch.setattr(overseerr_settings, "use_webhook", False)
+
+    content = Overseerr()
+    assert content.initialized
+    monkeypatch.setattr(content, "_fetch_imdb_id", lambda media_type, external_id: f"tt{external_id:07d}")
+    return content
+
+
+def test_pages_through_all_requests(content, api_calls):
+    items = list(content.run())
+    assert api_calls == [0, 2, 4]
+    assert sorted(item.overseerr_id for item in items) == [1, 2, 3, 4, 5]
+
+
+def test_stops_at_last_seen_request(content, requests_list, api_calls):
+    list(content.run())
+    api_calls.clear()
+
+    requests_list.insert(0, make_request(6, "2024-01-10T00:00:00.000Z"))
+    items = list(content.run())
+    assert api_calls == [0]
+    assert [item.overseerr_id for item in items] == [6]
+
+
+def test_failed_lookup_is_retried(content, monkeypatch, api_calls):
+    monkeypatch.setattr(
+        content, "_fetch_imdb_id", lambda media_type, external_id: None if external_id == 3 else f"tt{external_id:07d}"
+    )
+    items = list(content.run())
+    assert sorted(item.overseerr_id for item in items) == [1, 2, 4, 5]
+
+    # The watermark must not move past the request whose lookup failed
+    api_calls.clear()
+    monkeypatch.setattr(content, "_fetch_imdb_id", lambda media_type, external_id: f"tt{external_id:07d}")
+    items = list(content.run())
+    assert api_calls == [0, 2]
+    assert [item.overseerr_id for item in items] == [3]
+
+
+def test_request_not_yet_processing_is_retried(content, requests_list):
+    requests_list[1].media.status = 2
+    items = list(content.run())
+    assert sorted(item.overseerr_id for item in items) == [1, 3, 4, 5]
+
+    requests_list[1].media.status = 3
+    items = list(content.run())
+    assert [item.overseerr_id for item in items] == [2]
@@ -0,0 +1,60 @@
+import pytest
+from program.downloaders import realdebrid
+from program.downloaders.realdebrid import (
+    INSTANT_AVAILABILITY_CHUNK_SIZE,
+    _contains_valid_video_files,
+    _largest_first,
+    get_instant_availability,
+)
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """Record the instantAvailability hashes queried, answering with every hash available"""
+    calls = []
+    def get(url):
+        hashes = url.split("torrents/instantAvailability/", 1)[1].split("/")
+        calls.append(hashes)
+        return {infohash: {"rd": [{"1": {"filename": f"{infohash}.mkv", "filesize": 1}}]} for infohash in hashes}
+    monkeypatch.setattr(realdebrid, "get", get)
+    return calls
+
+
+def test_instant_availability_queries_each_hash_once(api_calls):
+    response = get_instant_availability(["ABC", "abc", "Def"])
+    assert api_calls == [["abc", "def"]]
+    # Results are keyed by the hashes exactly as the caller spelled them
+    assert set(response) == {"ABC", "abc", "Def"}
+    assert response["ABC"] == response["abc"]
+
+
+def test_instant_availability_skips_failing_chunk(monkeypatch):
+    hashes = [f"{i:040x}" for i in range(INSTANT_AVAILABILITY_CHUNK_SIZE + 1)]
+    def get(url):
+        chunk = url.split("torrents/instantAvailability/", 1)[1].split("/")
+        if len(chunk) == INSTANT_AVAILABILITY_CHUNK_SIZE:
+            raise Exception("chunk failed")
+        return {infohash: {"rd": []} for infohash in chunk}
+    monkeypatch.setattr(realdebrid, "get", get)
+
+    response = get_instant_availability(hashes)
+    assert list(response) == [hashes[-1]]
+
+
+def test_instant_availability_ignores_empty_list_reply(monkeypatch):
+    monkeypatch.setattr(realdebrid, "get", lambda url: [])
+    assert get_instant_availability(["abc"]) == {}
+
+
+def test_largest_first_keeps_ties_in_order():
+    small, first_big, second_big = {"1": {}}, {"1": {}, "2": {}}, {"3": {}, "4": {}}
+    assert list(_largest_first([small, first_big, second_big])) == [first_big, second_big, small]
+
+
+def test_valid_video_files_accepts_uppercase_extensions():
+    assert _contains_valid_video_files({"1": {"filename": "Movie.2019.MKV"}})
+
+
+def test_valid_video_files_rejects_samples_and_archives():
+    assert not _contains_valid_video_files({"1": {"filename": "Movie.mkv"}, "2": {"filename": "Movie.Sample.mkv"}})
+    assert not _contains_valid_video_files({"1": {"filename": "Movie.rar"}})
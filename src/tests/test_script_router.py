@@ -0,0 +1,45 @@
+import asyncio
+
+from controllers.script_router import SSE_ERROR_PREFIX, SSE_PREFIX, pump_frames, sse_frame
+
+
+class ChunkStream:
+    """Stream returning one of `chunks` per read, like a pipe written to in bursts"""
+    def __init__(self, *chunks: bytes):
+        self.chunks = list(chunks)
+
+    async def read(self, n: int) -> bytes:
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+def pump(*chunks: bytes, prefix: bytes = SSE_PREFIX) -> list[bytes]:
+    """Run pump_frames over `chunks` and return the frames it queued"""
+    async def run():
+        queue = asyncio.Queue()
+        await pump_frames(ChunkStream(*chunks), queue, prefix)
+        frames = []
+        while (frame := queue.get_nowait()) is not None:
+            frames.append(frame)
+        return frames
+    return asyncio.run(run())
+
+
+def test_sse_frame_prefixes_every_line():
+    assert sse_frame(b"a\nb") == b"data: a\ndata: b\n\n"
+    assert sse_frame(b"oops", SSE_ERROR_PREFIX) == b"data: Erreur: oops\n\n"
+
+
+def test_sse_frame_splits_carriage_returns():
+    assert sse_frame(b"10%\r20%\r30%") == b"data: 10%\ndata: 20%\ndata: 30%\n\n"
+    assert sse_frame(b"a\r\nb") == b"data: a\ndata: b\n\n"
+
+
+def test_pump_frames_streams_progress_output():
+    assert b"".join(pump(b"10%\r20%\r30%\n")) == b"data: 10%\ndata: 20%\ndata: 30%\n\n"
+    # Progress updates without any \n are still sent as they arrive
+    assert pump(b"10%\r", b"20%\r") == [b"data: 10%\n\n", b"data: 20%\n\n"]
+
+
+def test_pump_frames_keeps_crlf_split_across_reads():
+    # No empty line is sent for a \r\n cut in two by the reads
+    assert pump(b"a\r", b"\nb\n") == [b"data: a\ndata: b\n\n"]
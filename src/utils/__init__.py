@@ -3,4 +3,5 @@ from pathlib import Path
 root_dir = Path(__file__).resolve().parents[2]
 
 data_dir_path = root_dir / "data"
+logs_dir_path = data_dir_path / "logs"
 alembic_dir = data_dir_path / "alembic"
\ No newline at end of file
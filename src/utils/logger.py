@@ -16,14 +16,13 @@ from rich.progress import (
 )
 
 from program.settings.manager import settings_manager
-from utils import data_dir_path
+from utils import logs_dir_path
 from utils.websockets.logging_handler import Handler as WebSocketHandler
 
 LOG_ENABLED: bool = settings_manager.settings.log
 
 def setup_logger(level):
     """Setup the logger"""
-    logs_dir_path = data_dir_path / "logs"
     os.makedirs(logs_dir_path, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d-%H%M")
     log_filename = logs_dir_path / f"riven-{timestamp}.log"
@@ -119,7 +118,6 @@ def log_cleaner():
     """Remove old log files based on retention settings."""
     cleaned = False
     try:
-        logs_dir_path = data_dir_path / "logs"
         for log_file in logs_dir_path.glob("riven-*.log"):
             # remove files older than 8 hours
             if (datetime.now() - datetime.fromtimestamp(log_file.stat().st_mtime)).total_seconds() / 3600 > 8:
@@ -1,10 +1,13 @@
 import json
 import logging
+import time
 from contextlib import nullcontext
+from threading import Lock
 from types import SimpleNamespace
 from typing import Optional
 
 import requests
+from cachetools import TTLCache
 from lxml import etree
 from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectTimeout, RequestException
@@ -23,6 +26,17 @@ _retry_strategy = Retry(
 )
 _adapter = HTTPAdapter(max_retries=_retry_strategy)
 
+# Pooled sessions shared across the app, one per remote service
+POOLED_SESSION_IDLE_TIMEOUT = 5 * 60
+_pooled_sessions: dict[tuple[str, bool], tuple[requests.Session, float]] = {}
+_pooled_sessions_lock = Lock()
+
+# Services whose validation ping succeeded recently, settings reloads rebuild every
+# service and would otherwise ping all of them again
+PING_CACHE_TTL = 5 * 60
+_recent_pings = TTLCache(maxsize=64, ttl=PING_CACHE_TTL)
+_recent_pings_lock = Lock()
+
 
 class ResponseObject:
     """Response object"""
@@ -72,6 +86,53 @@ class ResponseObject:
             return {}
 
 
+def create_service_session(retry_if_failed=True) -> requests.Session:
+    """Create a session that keeps connections to a service alive between calls."""
+    session = requests.Session()
+    if retry_if_failed:
+        session.mount("http://", _adapter)
+        session.mount("https://", _adapter)
+    return session
+
+
+def get_pooled_session(key: str, retry_if_failed: bool = True) -> requests.Session:
+    """Return the shared session for the service `key`, creating it on first use.
+
+    Requests that must not be retried (post, put and delete by default) get their
+    own session per service, pass the same `retry_if_failed` as the request wrapper.
+    Sessions left idle for `POOLED_SESSION_IDLE_TIMEOUT` seconds are closed on the way.
+    """
+    pool_key = (key, retry_if_failed)
+    now = time.monotonic()
+    with _pooled_sessions_lock:
+        for idle_key, (idle_session, last_used) in list(_pooled_sessions.items()):
+            if idle_key != pool_key and now - last_used > POOLED_SESSION_IDLE_TIMEOUT:
+                idle_session.close()
+                del _pooled_sessions[idle_key]
+        session = _pooled_sessions[pool_key][0] if pool_key in _pooled_sessions else None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10, pool_maxsize=20, max_retries=_retry_strategy if retry_if_failed else 0
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        _pooled_sessions[pool_key] = (session, now)
+        return session
+
+
+def ping_recently_succeeded(*key) -> bool:
+    """Whether a validation ping identified by `key` succeeded within the last `PING_CACHE_TTL` seconds."""
+    with _recent_pings_lock:
+        return key in _recent_pings
+
+
+def remember_successful_ping(*key) -> None:
+    """Record a successful validation ping identified by `key`."""
+    with _recent_pings_lock:
+        _recent_pings[key] = True
+
+
 def _handle_request_exception() -> SimpleNamespace:
     """Handle exceptions during requests and return a namespace object."""
     logger.error("Request failed", exc_info=True)
@@ -90,12 +151,14 @@ def _make_request(
         proxies=None,
         json=None,
         specific_rate_limiter: Optional[RateLimiter] = None,
-        overall_rate_limiter: Optional[RateLimiter] = None
+        overall_rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None
 ) -> ResponseObject:
-    session = requests.Session()
-    if retry_if_failed:
-        session.mount("http://", _adapter)
-        session.mount("https://", _adapter)
+    # A caller-provided session is reused as-is and left open for the next call,
+    # its adapter decides on retries so it must match `retry_if_failed`
+    owns_session = session is None
+    if owns_session:
+        session = create_service_session(retry_if_failed)
 
     specific_context = specific_rate_limiter if specific_rate_limiter else nullcontext()
     overall_context = overall_rate_limiter if overall_rate_limiter else nullcontext()
@@ -110,7 +173,8 @@ def _make_request(
         logger.error(f"Request failed: {e}", exc_info=True)
         response = _handle_request_exception()
     finally:
-        session.close()
+        if owns_session:
+            session.close()
 
     return ResponseObject(response, response_type)
 
@@ -122,7 +186,8 @@ def ping(
         proxies=None,
         params=None,
         specific_rate_limiter: Optional[RateLimiter] = None,
-        overall_rate_limiter: Optional[RateLimiter] = None):
+        overall_rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None):
     return get(
         url,
         additional_headers=additional_headers,
@@ -130,7 +195,8 @@ def ping(
         timeout=timeout,
         proxies=proxies,
         specific_rate_limiter=specific_rate_limiter,
-        overall_rate_limiter=overall_rate_limiter)
+        overall_rate_limiter=overall_rate_limiter,
+        session=session)
 
 
 def get(
@@ -144,7 +210,8 @@ def get(
         proxies=None,
         json=None,
         specific_rate_limiter: Optional[RateLimiter] = None,
-        overall_rate_limiter: Optional[RateLimiter] = None
+        overall_rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None
 ) -> ResponseObject:
     """Requests get wrapper"""
     return _make_request(
@@ -159,7 +226,8 @@ def get(
         proxies=proxies,
         json=json,
         specific_rate_limiter=specific_rate_limiter,
-        overall_rate_limiter=overall_rate_limiter
+        overall_rate_limiter=overall_rate_limiter,
+        session=session
     )
 
 
@@ -174,7 +242,8 @@ def post(
         proxies=None,
         json: Optional[dict] = None,
         specific_rate_limiter: Optional[RateLimiter] = None,
-        overall_rate_limiter: Optional[RateLimiter] = None
+        overall_rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None
 ) -> ResponseObject:
     """Requests post wrapper"""
     return _make_request(
@@ -189,7 +258,8 @@ def post(
         response_type=response_type,
         json=json,
         specific_rate_limiter=specific_rate_limiter,
-        overall_rate_limiter=overall_rate_limiter
+        overall_rate_limiter=overall_rate_limiter,
+        session=session
     )
 
 
@@ -202,7 +272,8 @@ def put(
         proxies=None,
         json=None,
         specific_rate_limiter: Optional[RateLimiter] = None,
-        overall_rate_limiter: Optional[RateLimiter] = None
+        overall_rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None
 ) -> ResponseObject:
     """Requests put wrapper"""
     return _make_request(
@@ -215,7 +286,8 @@ def put(
         proxies=proxies,
         json=json,
         specific_rate_limiter=specific_rate_limiter,
-        overall_rate_limiter=overall_rate_limiter
+        overall_rate_limiter=overall_rate_limiter,
+        session=session
     )
 
 
@@ -228,7 +300,8 @@ def delete(
         proxies=None,
         json=None,
         specific_rate_limiter: Optional[RateLimiter] = None,
-        overall_rate_limiter: Optional[RateLimiter] = None
+        overall_rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None
 ) -> ResponseObject:
     """Requests delete wrapper"""
     return _make_request(
@@ -241,7 +314,8 @@ def delete(
         proxies=proxies,
         json=json,
         specific_rate_limiter=specific_rate_limiter,
-        overall_rate_limiter=overall_rate_limiter
+        overall_rate_limiter=overall_rate_limiter,
+        session=session
     )
 
 
@@ -6,8 +6,16 @@ from loguru import logger
 
 active_connections = []
 
+# Log messages are queued from any thread and sent from the server loop
+LOG_BATCH_SIZE = 128
+LOG_BATCH_WINDOW = 0.01
+_event_loop: asyncio.AbstractEventLoop | None = None
+_log_queue: asyncio.Queue | None = None
+_log_sender_task: asyncio.Task | None = None
+
 async def connect(websocket: WebSocket):
     await websocket.accept()
+    _start_log_sender()
     existing_connection = next((connection for connection in active_connections if connection.app == websocket.app), None)
     if not existing_connection:
         logger.debug("Frontend connected!")
@@ -21,13 +29,42 @@ async def connect(websocket: WebSocket):
 def disconnect(websocket: WebSocket):
     logger.debug("Frontend disconnected!")
     existing_connection = next((connection for connection in active_connections if connection.app == websocket.app), None)
-    active_connections.remove(existing_connection)
+    if existing_connection:
+        active_connections.remove(existing_connection)
 
-async def _send_json(message: json, websocket: WebSocket):
-    try:
-        await websocket.send_json(message)
-    except Exception:
-        pass
+def _start_log_sender():
+    """Start the log sender on the running server loop, once per process."""
+    global _event_loop, _log_queue, _log_sender_task
+    if _log_sender_task is not None:
+        return
+    _event_loop = asyncio.get_running_loop()
+    _log_queue = asyncio.Queue()
+    _log_sender_task = _event_loop.create_task(_log_sender())
+
+async def _log_sender():
+    """Coalesce log messages arriving within a short window into one frame."""
+    while True:
+        batch = [await _log_queue.get()]
+        deadline = _event_loop.time() + LOG_BATCH_WINDOW
+        while len(batch) < LOG_BATCH_SIZE:
+            timeout = deadline - _event_loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_log_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        # One entry per record, a record can itself span several lines (tracebacks).
+        # A separate type so clients that only know single "log" frames ignore it
+        await _broadcast({"type": "logs", "messages": batch})
+
+async def _broadcast(message: json):
+    """Send a message to all connections concurrently, dropping dead ones."""
+    connections = list(active_connections)
+    results = await asyncio.gather(*(connection.send_json(message) for connection in connections), return_exceptions=True)
+    for connection, result in zip(connections, results):
+        if isinstance(result, Exception) and connection in active_connections:
+            active_connections.remove(connection)
 
 def send_event_update(events: list):
     event_types = ["Scraping", "Downloader", "Symlinker", "Updater", "PostProcessing"]
@@ -38,22 +75,30 @@ def send_health_update(status: str):
     broadcast({"type": "health", "status": status})
 
 def send_log_message(message: str):
-    broadcast({"type": "log", "message": message})
+    """Queue a log message without blocking the logging thread."""
+    if not active_connections or _log_queue is None:
+        return
+    try:
+        _event_loop.call_soon_threadsafe(_log_queue.put_nowait, message)
+    except RuntimeError:
+        # Event loop already closed during shutdown
+        pass
 
 def send_item_update(item: json):
     broadcast({"type": "item_update", "item": item})
 
 def broadcast(message: json):
-    for connection in active_connections:
-        event_loop = None
-        try:
-            event_loop = asyncio.get_event_loop()
-        except RuntimeError:
-            pass
-        try:
-            if event_loop and event_loop.is_running():
-                asyncio.create_task(_send_json(message, connection))
-            else:
-                asyncio.run(_send_json(message, connection))
-        except Exception:
-            pass
+    if not active_connections or _event_loop is None:
+        return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    try:
+        if running_loop is _event_loop:
+            _event_loop.create_task(_broadcast(message))
+        else:
+            asyncio.run_coroutine_threadsafe(_broadcast(message), _event_loop)
+    except RuntimeError:
+        # Event loop already closed during shutdown
+        pass